@@ -6,7 +6,14 @@ from __future__ import annotations
 import shutil
 import subprocess
 import sys
-from typing import List
+from pathlib import Path
+from typing import List, Optional
+
+SERVICE = "resume-generator"
+# Must match ``container_name`` in docker-compose.yml
+CONTAINER = "curriculo-generator"
+# Remembers which docker compose flavour was detected on this machine
+COMPOSE_CACHE = Path.home() / ".cache" / "resume-gen" / "docker_compose_cmd"
 
 
 def _color(code: str, msg: str) -> str:
@@ -25,11 +32,36 @@ def print_error(msg: str) -> None:
     print(_color("0;31", f"❌ {msg}"))
 
 
+def _read_compose_cache() -> Optional[List[str]]:
+    try:
+        cmd = COMPOSE_CACHE.read_text(encoding="utf-8").split()
+    except OSError:
+        return None
+    # Discard the cache if the cached binary has been uninstalled
+    if cmd and shutil.which(cmd[0]):
+        return cmd
+    return None
+
+
+def _write_compose_cache(cmd: List[str]) -> None:
+    try:
+        COMPOSE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        COMPOSE_CACHE.write_text(" ".join(cmd), encoding="utf-8")
+    except OSError:
+        pass
+
+
 def check_docker() -> List[str]:
     """Ensure Docker and Docker Compose are available.
 
-    Returns the docker compose command as a list.
+    Returns the docker compose command as a list. The detected command is
+    cached in ``COMPOSE_CACHE`` so later calls skip the daemon round-trip
+    of ``docker compose version``.
     """
+    cached = _read_compose_cache()
+    if cached:
+        return cached
+
     if not shutil.which("docker"):
         print_error("Docker não está instalado!")
         print("Por favor, instale o Docker primeiro:")
@@ -37,6 +69,7 @@ def check_docker() -> List[str]:
         sys.exit(1)
 
     if shutil.which("docker-compose"):
+        _write_compose_cache(["docker-compose"])
         return ["docker-compose"]
     result = subprocess.run(
         ["docker", "compose", "version"],
@@ -44,6 +77,7 @@ def check_docker() -> List[str]:
         stderr=subprocess.DEVNULL,
     )
     if result.returncode == 0:
+        _write_compose_cache(["docker", "compose"])
         return ["docker", "compose"]
 
     print_error("Docker Compose não está instalado!")
@@ -52,37 +86,81 @@ def check_docker() -> List[str]:
     sys.exit(1)
 
 
+def _container_running() -> bool:
+    result = subprocess.run(
+        ["docker", "inspect", "-f", "{{.State.Running}}", CONTAINER],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    return result.returncode == 0 and result.stdout.strip() == "true"
+
+
+def ensure_container(dc: List[str]) -> None:
+    """Start the long-lived service container if it is not running yet."""
+    if not _container_running():
+        subprocess.check_call(dc + ["up", "-d", SERVICE])
+
+
+def _exec(args: List[str], interactive: bool = False) -> List[str]:
+    flags = ["-i"] if interactive else []
+    if interactive and sys.stdin.isatty():
+        flags.append("-t")
+    return ["docker", "exec"] + flags + [CONTAINER] + args
+
+
 def build_image(dc: List[str]) -> None:
     print_header("Construindo imagem Docker")
     subprocess.check_call(dc + ["build"])
+    if _container_running():
+        # Recreate the running container so it picks up the new image
+        subprocess.check_call(dc + ["up", "-d", SERVICE])
     print_success("Imagem construída com sucesso!")
 
 
 def run_generator(dc: List[str]) -> None:
     print_header("Executando gerador de currículos")
-    subprocess.check_call(dc + [
-        "run",
-        "--rm",
-        "resume-generator",
-        "python3",
-        "scripts/main.py",
-    ])
+    ensure_container(dc)
+    # Interactive so that Ctrl-C reaches main.py inside the container
+    subprocess.check_call(_exec(["python3", "scripts/main.py"], interactive=True))
     print_success("Geração de currículos concluída!")
     print("Os arquivos foram gerados na pasta 'outputs/'")
 
 
 def run_custom(dc: List[str], args: List[str]) -> None:
     print_header(f"Executando comando customizado: {' '.join(args)}")
-    subprocess.check_call(dc + ["run", "--rm", "resume-generator"] + args)
+    ensure_container(dc)
+    subprocess.check_call(_exec(args, interactive=True))
 
 
 def run_shell(dc: List[str]) -> None:
     print_header("Abrindo shell interativo no container")
-    subprocess.check_call(dc + ["run", "--rm", "resume-generator", "bash"])
+    ensure_container(dc)
+    subprocess.check_call(_exec(["bash"], interactive=True))
+
+
+def build_and_run(dc: List[str]) -> None:
+    build_image(dc)
+    run_generator(dc)
+
+
+def stop(dc: List[str]) -> None:
+    print_header("Parando o container")
+    subprocess.check_call(dc + ["stop", SERVICE])
+    print_success("Container parado!")
+
+
+def down(dc: List[str]) -> None:
+    print_header("Removendo o container")
+    subprocess.check_call(dc + ["down"])
+    print_success("Container removido!")
 
 
 def clean(dc: List[str]) -> None:
     print_header("Limpando containers e imagens Docker")
+    # --volumes também remove os caches persistentes do TeX (texmf-var e
+    # fontconfig-cache); a próxima compilação volta a gerá-los do zero.
+    print("Os caches do TeX (texmf-var, fontconfig-cache) também serão removidos")
     subprocess.call(dc + [
         "down",
         "--rmi",
@@ -94,47 +172,54 @@ def clean(dc: List[str]) -> None:
     print_success("Limpeza concluída!")
 
 
-def logs(dc: List[str]) -> None:
-    print_header("Mostrando logs do container")
-    subprocess.check_call(dc + ["logs", "-f", "resume-generator"])
-
-
 def show_help() -> None:
     print("🐳 Script Docker para Gerador de Currículos")
     print()
     print("COMANDOS DISPONÍVEIS:")
     print("  build     - Constrói a imagem Docker")
     print("  run       - Executa o gerador de currículos")
+    print("  build-run - Constrói a imagem e executa o gerador")
     print("  shell     - Abre shell interativo no container")
-    print("  clean     - Remove containers e imagens Docker")
-    print("  logs      - Mostra logs do container")
+    print("  stop      - Para o container mantido em execução")
+    print("  down      - Remove o container mantido em execução")
+    print("  clean     - Remove containers, imagens e caches do TeX")
     print("  help      - Mostra esta ajuda")
     print()
     print("EXEMPLOS:")
     print("  python docker_run.py build")
     print("  python docker_run.py run")
     print()
+    print("Os comandos run, shell e customizados reutilizam um container em")
+    print("execução (docker exec); use 'stop' ou 'down' para encerrá-lo.")
+    print("Alterações no .env (ex.: GEMINI_API_KEY) só valem depois de 'down'")
+    print("seguido de um novo 'run', que recria o container.")
+    print()
     print("COMANDOS CUSTOMIZADOS:")
     print("  python docker_run.py python3 scripts/main.py")
     print("  python docker_run.py python3 scripts/scrape_jobs.py")
 
 
 def main(argv: List[str]) -> None:
-    dc = check_docker()
     cmd = argv[1] if len(argv) > 1 else "help"
+    if cmd in {"help", "--help", "-h"}:
+        show_help()
+        return
 
+    dc = check_docker()
     if cmd == "build":
         build_image(dc)
+    elif cmd == "build-run":
+        build_and_run(dc)
     elif cmd == "run":
         run_generator(dc)
     elif cmd == "shell":
         run_shell(dc)
+    elif cmd == "stop":
+        stop(dc)
+    elif cmd == "down":
+        down(dc)
     elif cmd == "clean":
         clean(dc)
-    elif cmd == "logs":
-        logs(dc)
-    elif cmd in {"help", "--help", "-h"}:
-        show_help()
     else:
         run_custom(dc, argv[1:])
 
@@ -2,99 +2,263 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
 import shutil
 import subprocess
+import tempfile
+import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any
+from typing import Deque, Dict, Any, List, Tuple
 
+logger = logging.getLogger(__name__)
 
 LATEX_SRC = Path(__file__).resolve().parents[1] / "latex"
+# Files in the template that get rewritten per job and therefore must be
+# real copies rather than hard links to the source tree.
+MUTABLE_FILES = ("resume.tex",)
+# Build artefacts left in the template by a local compile; they are not
+# needed by the job and would be shared through a hard link otherwise.
+# Only the resume's own PDF is skipped, since figures may be PDFs too.
+BUILD_ARTIFACTS = (
+    "resume.pdf", "*.log", "*.aux", "*.bbl", "*.bcf", "*.blg", "*.out",
+    "*.fls", "*.fdb_latexmk", "*.run.xml", "*.synctex.gz", "*.xdv",
+)
+
+# Auxiliary files (.aux, .log, .bcf, ...) are written here instead of the
+# job directory; /dev/shm is a tmpfs on Linux (and inside Docker).
+BUILD_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+# Log messages emitted by LaTeX packages when another pass is required.
+# biblatex's "Please (re)run Biber" is left out: it is printed whenever no
+# .bbl exists, even with nothing to cite, and a pass after biber always
+# follows anyway when biber does run.
+RERUN_MARKERS = (
+    "Rerun to get",
+    "Please rerun LaTeX",
+    "Label(s) may have changed",
+)
+# Number of trailing log lines kept for error reports
+LOG_TAIL_LINES = 200
+# Niceness added to LaTeX processes so they don't starve scraping/API work
+COMPILE_NICENESS = 5
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hard link *src* to *dst*, falling back to a copy.
+
+    Linking fails across filesystems (e.g. a bind-mounted ``outputs``
+    directory) or on filesystems without hard link support.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _replace_file(src: Path, dst: Path) -> None:
+    """Copy *src* over *dst* without writing through an existing hard link.
+
+    The copy goes to a temporary file that then replaces *dst*, so a *dst*
+    linked to another file is detached instead of overwritten.
+    """
+    with tempfile.NamedTemporaryFile(dir=dst.parent, prefix=f".{dst.name}.", delete=False) as tmp_file:
+        with src.open("rb") as src_file:
+            shutil.copyfileobj(src_file, tmp_file)
+    os.chmod(tmp_file.name, 0o644)
+    os.replace(tmp_file.name, dst)
 
 
 def prepare_job_directory(job_dir: Path) -> None:
-    """Copy the LaTeX source tree into *job_dir*.
+    """Populate *job_dir* with the LaTeX source tree.
 
-    The directory will contain a full copy of the ``latex`` folder so the
-    generated resume can be compiled in isolation.
+    The template assets (class file, fonts, images, sections) are never
+    modified, so they are hard linked instead of copied. Only the files in
+    ``MUTABLE_FILES`` are copied, since writing to a hard link would
+    overwrite the template itself, and ``BUILD_ARTIFACTS`` are skipped.
     """
-    print(f"📁 Preparing job directory: {job_dir}")
     if job_dir.exists():
-        print(f"🗑️ Removing existing directory: {job_dir}")
+        logger.debug("🗑️ Removing existing directory: %s", job_dir)
         shutil.rmtree(job_dir)
-    print(f"📋 Copying LaTeX source from {LATEX_SRC} to {job_dir}")
-    shutil.copytree(LATEX_SRC, job_dir)
-    print(f"✅ Job directory prepared successfully")
+    logger.debug("📋 Linking LaTeX source from %s to %s", LATEX_SRC, job_dir)
+    skip_artifacts = shutil.ignore_patterns(*BUILD_ARTIFACTS)
+    shutil.copytree(
+        LATEX_SRC,
+        job_dir,
+        copy_function=_link_or_copy,
+        ignore=lambda src, names: (
+            skip_artifacts(src, names) | (set(MUTABLE_FILES) if Path(src) == LATEX_SRC else set())
+        ),
+    )
+    for name in MUTABLE_FILES:
+        shutil.copy2(LATEX_SRC / name, job_dir / name)
+
+
+def _write_chunks(path: Path, chunks: List[bytes]) -> None:
+    """Write *chunks* to *path* with as few system calls as possible.
+
+    ``os.writev`` sends all fragments in a single scatter-gather write; on
+    platforms without it the fragments are written one by one.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        total = sum(len(chunk) for chunk in chunks)
+        written = os.writev(fd, chunks) if hasattr(os, "writev") else 0
+        if written < total:
+            # Partial (or no) vectored write: finish with plain writes
+            view = memoryview(b"".join(chunks))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def write_job_summary(job: Dict[str, Any], job_dir: Path) -> None:
     """Create a markdown file summarising the job posting."""
-    print(f"📝 Writing job summary to {job_dir / 'job.md'}")
-    lines = [f"# {job.get('title', 'Job')}\n"]
+    chunks = [f"# {job.get('title', 'Job')}\n".encode("utf-8")]
     for key, value in job.items():
         if key == "title":
             continue
-        lines.append(f"**{key.capitalize()}:** {value}\n")
-    (job_dir / "job.md").write_text("\n".join(lines), encoding="utf-8")
-    print(f"✅ Job summary written ({len(lines)} lines)")
+        chunks.append(f"\n**{key.capitalize()}:** {value}\n".encode("utf-8"))
+    _write_chunks(job_dir / "job.md", chunks)
+    logger.debug("📝 Job summary written to %s (%d lines)", job_dir / "job.md", len(chunks))
+
+
+def write_resume(tailored: str, job_dir: Path) -> Path:
+    """Write the tailored LaTeX source to ``resume.tex`` in *job_dir*."""
+    tailored_file = job_dir / "resume.tex"
+    _write_chunks(tailored_file, [tailored.encode("utf-8")])
+    return tailored_file
 
 
-def compile_pdf(job_dir: Path) -> None:
-    """Compile ``resume.tex`` inside *job_dir* using ``xelatex`` and ``biber``."""
-    print(f"🔧 Starting PDF compilation in {job_dir}")
+def _lower_priority(pid: int) -> None:
+    """Lower the scheduling priority of the already started process *pid*.
 
+    Done from the parent rather than with ``preexec_fn``, which is unsafe
+    while other threads are running.
+    """
+    if not hasattr(os, "setpriority"):
+        return
     try:
-        # First XeLaTeX run
-        print("📄 Running first XeLaTeX compilation...")
-        result1 = subprocess.run(
-            ["xelatex", "-interaction=nonstopmode", "resume.tex"],
-            cwd=job_dir,
-            check=False,  # Don't fail on warnings
-            capture_output=True,
-            text=True,
-        )
-        print(f"📄 First XeLaTeX run completed (exit code: {result1.returncode})")
-
-        # Run Biber for bibliography processing
-        print("📚 Running Biber for bibliography processing...")
-        biber_result = subprocess.run(
-            ["biber", "resume"],
-            cwd=job_dir,
-            check=False,  # Don't fail if no bibliography
-            capture_output=True,
-            text=True,
-        )
-        print(f"📚 Biber run completed (exit code: {biber_result.returncode})")
-
-        # Second XeLaTeX run to resolve references
-        print("📄 Running second XeLaTeX compilation...")
-        result2 = subprocess.run(
-            ["xelatex", "-interaction=nonstopmode", "resume.tex"],
-            cwd=job_dir,
-            check=False,  # Don't fail on warnings
-            capture_output=True,
-            text=True,
-        )
-        print(f"📄 Second XeLaTeX run completed (exit code: {result2.returncode})")
-
-        # Check if PDF was actually created
-        pdf_file = job_dir / "resume.pdf"
-        if pdf_file.exists():
-            pdf_size = pdf_file.stat().st_size
-            print(f"✅ PDF compilation successful! Generated file: {pdf_file} ({pdf_size} bytes)")
-        else:
-            print("❌ PDF compilation failed - no PDF file generated")
-            print("📋 XeLaTeX output from final run:")
-            print(result2.stdout)
-            if result2.stderr:
-                print("📋 XeLaTeX stderr:")
-                print(result2.stderr)
-            raise subprocess.CalledProcessError(result2.returncode, result2.args)
-
-    except subprocess.CalledProcessError as e:
-        print(f"❌ LaTeX compilation failed with return code {e.returncode}")
-        print("📋 LaTeX output:")
-        print(e.stdout)
-        if e.stderr:
-            print("📋 LaTeX stderr:")
-            print(e.stderr)
-        raise
+        current = os.getpriority(os.PRIO_PROCESS, pid)
+        os.setpriority(os.PRIO_PROCESS, pid, current + COMPILE_NICENESS)
+    except OSError:
+        pass  # The process already exited or the platform refuses it
+
+
+async def _run_logged(args: List[str], cwd: Path) -> Tuple[int, str]:
+    """Run *args* in *cwd*, streaming its output line by line.
+
+    Only the last ``LOG_TAIL_LINES`` lines are kept for error reporting, so
+    memory use does not grow with the size of the LaTeX log. The child is
+    awaited through the event loop, so concurrent compiles don't each need
+    a blocked thread.
+    """
+    tail: Deque[bytes] = deque(maxlen=LOG_TAIL_LINES)
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    _lower_priority(proc.pid)
+    assert proc.stdout is not None
+    async for line in proc.stdout:
+        tail.append(line)
+    returncode = await proc.wait()
+    return returncode, b"".join(tail).decode("utf-8", errors="replace")
+
+
+def _xelatex_cmd(out_dir: Path) -> List[str]:
+    return ["xelatex", "-interaction=nonstopmode", f"-output-directory={out_dir}", "resume.tex"]
+
+
+def _biber_cmd(out_dir: Path) -> List[str]:
+    return ["biber", "--input-directory", str(out_dir), "--output-directory", str(out_dir), "resume"]
+
+
+def _latexmk_cmd(out_dir: Path) -> List[str]:
+    return ["latexmk", "-xelatex", "-interaction=nonstopmode", f"-outdir={out_dir}", "resume.tex"]
+
+
+def _needs_biber(out_dir: Path) -> bool:
+    """Return ``True`` if the document cites anything biber must resolve."""
+    bcf = out_dir / "resume.bcf"
+    return bcf.exists() and "<bcf:citekey" in bcf.read_text(encoding="utf-8", errors="replace")
+
+
+def _needs_rerun(out_dir: Path) -> bool:
+    """Return ``True`` if the last XeLaTeX run asked to be rerun."""
+    log = out_dir / "resume.log"
+    if not log.exists():
+        return False
+    text = log.read_text(encoding="utf-8", errors="replace")
+    return any(marker in text for marker in RERUN_MARKERS)
+
+
+async def _compile_manually(job_dir: Path, out_dir: Path) -> Tuple[int, List[str], str]:
+    """Run XeLaTeX, then biber and a second pass only when required."""
+    xelatex_cmd = _xelatex_cmd(out_dir)
+    returncode, output = await _run_logged(xelatex_cmd, job_dir)
+
+    ran_biber = False
+    if _needs_biber(out_dir):
+        # Don't fail if no bibliography
+        await _run_logged(_biber_cmd(out_dir), job_dir)
+        ran_biber = True
+
+    if ran_biber or _needs_rerun(out_dir):
+        returncode, output = await _run_logged(xelatex_cmd, job_dir)
+
+    return returncode, xelatex_cmd, output
+
+
+async def compile_pdf(job_dir: Path) -> None:
+    """Compile ``resume.tex`` inside *job_dir* into ``resume.pdf``.
+
+    ``latexmk`` is used when available so that biber and extra XeLaTeX
+    passes only run when the document actually needs them. Otherwise the
+    same decision is made from the ``.bcf`` and ``.log`` files.
+
+    Intermediate files are produced in a temporary directory under
+    ``BUILD_ROOT``; only ``resume.pdf`` (and ``resume.log`` on failure) is
+    copied back into *job_dir*.
+    """
+    start_time = time.monotonic()
+    with tempfile.TemporaryDirectory(prefix="resume_", dir=BUILD_ROOT) as tmp:
+        out_dir = Path(tmp)
+        try:
+            if shutil.which("latexmk"):
+                args = _latexmk_cmd(out_dir)
+                returncode, output = await _run_logged(args, job_dir)
+            else:
+                returncode, args, output = await _compile_manually(job_dir, out_dir)
+
+            # Check if PDF was actually created (warnings don't fail the build)
+            built_pdf = out_dir / "resume.pdf"
+            if built_pdf.exists():
+                pdf_file = job_dir / "resume.pdf"
+                _replace_file(built_pdf, pdf_file)
+                logger.info(
+                    "✅ PDF compiled: %s (%d bytes, %.2fs)",
+                    pdf_file,
+                    pdf_file.stat().st_size,
+                    time.monotonic() - start_time,
+                )
+            else:
+                if (out_dir / "resume.log").exists():
+                    _replace_file(out_dir / "resume.log", job_dir / "resume.log")
+                raise subprocess.CalledProcessError(returncode, args, output=output)
+
+        except subprocess.CalledProcessError as e:
+            logger.error(
+                "❌ LaTeX compilation failed in %s with return code %s - no PDF generated\n"
+                "📋 LaTeX output (last %d lines):\n%s",
+                job_dir,
+                e.returncode,
+                LOG_TAIL_LINES,
+                e.stdout,
+            )
+            raise
@@ -6,8 +6,13 @@ The actual API key must be supplied in the environment variable
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
+import re
+import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -17,8 +22,76 @@ from google.api_core.exceptions import ResourceExhausted
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = "gemini-2.0-flash-lite"
+# Job descriptions longer than this are truncated before being sent
+MAX_JOB_DESC_CHARS = 4000
+# Responses are cached here keyed by a hash of the prompt, so re-running the
+# pipeline on the same jobs does not call the API again. Callers drop an
+# entry whose resume fails to compile (see ``discard_cached_resume``).
+CACHE_DIR = Path(__file__).resolve().parents[1] / "outputs" / ".cache" / "gemini"
+
+_SPACES_RE = re.compile(r"[ \t\u00a0]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+
+PROMPT_TEMPLATE = (
+    "You are an assistant that customizes LaTeX resumes. Given the job "
+    "description and the base resume, rewrite the resume so that it "
+    "highlights the most relevant skills and experience for the job. "
+    "IMPORTANT FORMATTING RULES:\n"
+    "- Keep the EXACT structure and formatting of the original resume\n"
+    "- Do NOT add extra blank lines or indentation\n"
+    "- Do NOT reformat the LaTeX spacing\n"
+    "- Only modify the CONTENT within sections, not the structure\n"
+    "- Preserve the exact line breaks and spacing from the original\n"
+    "- Focus ONLY on tailoring the content to match the job requirements\n"
+    "Return only valid LaTeX code with the original formatting preserved.\n\n"
+    "Job description:\n{job_desc}\n\n"
+    "Base resume:\n{base_resume}\n"
+)
+
+
+@lru_cache(maxsize=None)
+def _get_model() -> genai.GenerativeModel:
+    """Configure the Gemini client once and return a shared model."""
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        raise RuntimeError("GEMINI_API_KEY environment variable not set")
+
+    logger.debug("🔑 Configuring Gemini API...")
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(MODEL_NAME)
+
+
+def _compact_description(text: str) -> str:
+    """Collapse scraped whitespace and cap the description length."""
+    text = _SPACES_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text).strip()
+    return text[:MAX_JOB_DESC_CHARS]
+
+
+def _cache_path(prompt: str) -> Path:
+    key = hashlib.sha256(f"{MODEL_NAME}\n{prompt}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.tex"
+
 
-def tailor_resume(job: Dict[str, Any], base_resume: str | Path) -> str:
+def _build_prompt(job: Dict[str, Any], base_resume: str) -> str:
+    job_desc = _compact_description(job.get("description") or "")
+    return PROMPT_TEMPLATE.format(job_desc=job_desc, base_resume=base_resume)
+
+
+def discard_cached_resume(job: Dict[str, Any], base_resume: str) -> None:
+    """Forget the cached response for *job*, so the next run asks Gemini again."""
+    cache_file = _cache_path(_build_prompt(job, base_resume))
+    try:
+        cache_file.unlink()
+        logger.info("🗑️ Discarded cached Gemini response: %s", cache_file.name)
+    except FileNotFoundError:
+        pass
+
+
+def tailor_resume(job: Dict[str, Any], base_resume: str) -> str:
     """Return a resume tailored to *job*.
 
     Parameters
@@ -27,42 +100,25 @@ def tailor_resume(job: Dict[str, Any], base_resume: str | Path) -> str:
         Dictionary with information about the job opening. The ``description``
         field is particularly important.
     base_resume:
-        Path to the base LaTeX resume used as a starting point.
+        LaTeX source of the base resume used as a starting point. Callers
+        tailoring several jobs should read it once and reuse the string.
     """
-    print(f"🤖 Starting resume tailoring for job: {job.get('title', 'Unknown')}")
+    prompt = _build_prompt(job, base_resume)
 
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        raise RuntimeError("GEMINI_API_KEY environment variable not set")
+    cache_file = _cache_path(prompt)
+    if cache_file.exists():
+        logger.info("♻️ Reusing cached Gemini response: %s", cache_file.name)
+        return cache_file.read_text(encoding="utf-8")
 
-    print("🔑 Configuring Gemini API...")
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel("gemini-2.0-flash-lite")
-
-    print("📄 Reading base resume template...")
-    base_resume = Path(base_resume).read_text(encoding="utf-8")
-    job_desc = job.get("description", "")
-
-    print(f"📝 Job description length: {len(job_desc)} characters")
-    print(f"📝 Base resume length: {len(base_resume)} characters")
-
-    prompt = (
-        "You are an assistant that customizes LaTeX resumes. Given the job "
-        "description and the base resume, rewrite the resume so that it "
-        "highlights the most relevant skills and experience for the job. "
-        "IMPORTANT FORMATTING RULES:\n"
-        "- Keep the EXACT structure and formatting of the original resume\n"
-        "- Do NOT add extra blank lines or indentation\n"
-        "- Do NOT reformat the LaTeX spacing\n"
-        "- Only modify the CONTENT within sections, not the structure\n"
-        "- Preserve the exact line breaks and spacing from the original\n"
-        "- Focus ONLY on tailoring the content to match the job requirements\n"
-        "Return only valid LaTeX code with the original formatting preserved.\n\n"
-        f"Job description:\n{job_desc}\n\n"
-        f"Base resume:\n{base_resume}\n"
-    )
-
-    print(f"📤 Sending prompt to Gemini API (length: {len(prompt)} characters)...")
+    model = _get_model()
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "📤 Sending prompt to Gemini API (job description: %d, base resume: %d, prompt: %d characters)",
+            len(_compact_description(job.get("description") or "")),
+            len(base_resume),
+            len(prompt),
+        )
 
     # Retry logic for rate limiting
     max_retries = 3
@@ -70,16 +126,29 @@ def tailor_resume(job: Dict[str, Any], base_resume: str | Path) -> str:
 
     for attempt in range(max_retries):
         try:
-            print(f"🔄 API call attempt {attempt + 1}/{max_retries}...")
-            response = model.generate_content(prompt)
-            print(f"✅ Successfully received response from Gemini API (length: {len(response.text)} characters)")
-            return response.text
+            # Stream the answer so chunks are consumed as they arrive
+            response = model.generate_content(prompt, stream=True)
+            text = "".join(chunk.text for chunk in response)
+            logger.info("✅ Received response from Gemini API (%d characters)", len(text))
+            # Write then rename so concurrent runs never read a partial file
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=CACHE_DIR, suffix=".tmp", delete=False
+            ) as tmp_file:
+                tmp_file.write(text)
+            os.replace(tmp_file.name, cache_file)
+            return text
         except ResourceExhausted as e:
             if attempt < max_retries - 1:
                 # Extract retry delay from error if available, otherwise use exponential backoff
                 retry_delay = base_delay * (2 ** attempt)
-                print(f"⚠️ Rate limit exceeded. Retrying in {retry_delay} seconds... (attempt {attempt + 1}/{max_retries})")
+                logger.warning(
+                    "⚠️ Rate limit exceeded. Retrying in %d seconds... (attempt %d/%d)",
+                    retry_delay,
+                    attempt + 1,
+                    max_retries,
+                )
                 time.sleep(retry_delay)
             else:
-                print("❌ Max retries exceeded. Please wait before running again or consider upgrading your API plan.")
+                logger.error("❌ Max retries exceeded. Please wait before running again or consider upgrading your API plan.")
                 raise
@@ -0,0 +1,45 @@
+"""Logging setup shared by the pipeline scripts.
+
+Records are handed to a :class:`~logging.handlers.QueueHandler` and written
+to stdout by a :class:`~logging.handlers.QueueListener` running on its own
+thread, so concurrent jobs never block on console I/O.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: Optional[int | str] = None) -> None:
+    """Route all log records through a background writer thread.
+
+    Without *level*, the ``LOG_LEVEL`` environment variable is used (e.g.
+    ``LOG_LEVEL=DEBUG`` shows per-page and per-job progress), defaulting to
+    ``INFO``. Calling this more than once only updates the log level.
+    """
+    global _listener
+
+    if level is None:
+        level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    root = logging.getLogger()
+    root.setLevel(level)
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root.handlers[:] = [QueueHandler(log_queue)]
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush whatever is still queued when the interpreter exits
+    atexit.register(_listener.stop)
@@ -2,89 +2,185 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import os
+import subprocess
+import sys
 import time
 from pathlib import Path
+from typing import Any, Dict
 
 from scrape_jobs import scrape_jobs
-from gemini_api import tailor_resume
-from build_resume import prepare_job_directory, write_job_summary, compile_pdf
+from gemini_api import discard_cached_resume, tailor_resume
+from build_resume import (
+    LATEX_SRC,
+    prepare_job_directory,
+    write_job_summary,
+    write_resume,
+    compile_pdf,
+)
+from log_config import setup_logging
+
+logger = logging.getLogger(__name__)
 
 CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "job_config.yaml"
 OUTPUT_ROOT = Path(__file__).resolve().parents[1] / "outputs"
 
+# Maximum number of Gemini requests in flight at the same time
+MAX_CONCURRENT_REQUESTS = 2
+# Minimum spacing (seconds) between the start of two Gemini requests
+GEMINI_REQUEST_INTERVAL = 5.0
+# Maximum number of LaTeX builds running at the same time (one per core)
+MAX_CONCURRENT_COMPILES = os.cpu_count() or 1
+
+
+class _RequestThrottle:
+    """Space out request starts by at least *interval* seconds.
+
+    Unlike a fixed ``sleep`` between jobs, waiting here only delays the next
+    API call, so LaTeX compilation of other jobs keeps running meanwhile.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+                now += delay
+            self._next_slot = now + self._interval
+
+
+def _description_key(job: Dict[str, Any]) -> str:
+    """Return a key shared by jobs whose descriptions only differ in case/spacing."""
+    normalized = " ".join((job.get("description") or "").casefold().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _ResumePipeline:
+    """Shared state for processing the jobs of one run concurrently."""
+
+    def __init__(self, base_resume: str, output_root: Path, total: int) -> None:
+        self.base_resume = base_resume
+        self.output_root = output_root
+        self.total = total
+        # Gemini calls are capped and spaced out to respect the API quota,
+        # and LaTeX builds are capped at one per CPU core.
+        self.api_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.throttle = _RequestThrottle(GEMINI_REQUEST_INTERVAL)
+        self.compile_slots = asyncio.Semaphore(MAX_CONCURRENT_COMPILES)
+        # One Gemini request per distinct description, shared by duplicates
+        self.tailored: Dict[str, asyncio.Task] = {}
+
+    async def _tailor(self, job: Dict[str, Any]) -> str:
+        async with self.api_slots:
+            await self.throttle.wait()
+            return await asyncio.to_thread(tailor_resume, job, self.base_resume)
+
+    def tailor(self, job: Dict[str, Any], tag: str) -> asyncio.Task:
+        key = _description_key(job)
+        task = self.tailored.get(key)
+        if task is None:
+            task = self.tailored[key] = asyncio.ensure_future(self._tailor(job))
+        else:
+            logger.info("♻️ %s Same description as an earlier job, reusing its tailored resume", tag)
+        return task
+
+    async def process_job(self, idx: int, job: Dict[str, Any]) -> None:
+        tag = f"[job {idx}/{self.total}]"
+        logger.info(
+            "🔄 %s Processing: %s | 🏢 %s | 📍 %s",
+            tag,
+            job.get("title", "Unknown"),
+            job.get("company", "Unknown"),
+            job.get("location", "Unknown"),
+        )
 
-def generate_resumes(config_path: Path = CONFIG_PATH, output_root: Path = OUTPUT_ROOT) -> None:
-    print("🚀 Starting resume generation pipeline...")
-    print(f"📂 Config file: {config_path}")
-    print(f"📂 Output directory: {output_root}")
+        job_start_time = time.time()
+        job_dir = self.output_root / f"job_{idx}"
 
-    start_time = time.time()
+        # Step 1: Prepare directory
+        logger.debug("📁 %s Step 1/5: Preparing job directory...", tag)
+        await asyncio.to_thread(prepare_job_directory, job_dir)
 
-    print("\n" + "="*60)
-    print("📡 PHASE 1: JOB SCRAPING")
-    print("="*60)
+        # Step 2: Write job summary
+        logger.debug("📝 %s Step 2/5: Writing job summary...", tag)
+        await asyncio.to_thread(write_job_summary, job, job_dir)
 
-    jobs = scrape_jobs(config_path)
-    print(f"\n✅ Job scraping completed! Found {len(jobs)} jobs to process")
+        # Step 3: Tailor resume with AI
+        logger.debug("🤖 %s Step 3/5: Tailoring resume with AI...", tag)
+        tailored = await self.tailor(job, tag)
 
-    if not jobs:
-        print("⚠️ No jobs found. Exiting...")
-        return
+        # Step 4: Save tailored resume
+        tailored_file = write_resume(tailored, job_dir)
+        logger.debug("💾 %s Step 4/5: Tailored resume saved to: %s", tag, tailored_file)
 
-    print(f"\n📂 Creating output directory: {output_root}")
-    output_root.mkdir(exist_ok=True)
+        # Step 5: Compile PDF
+        logger.debug("🔧 %s Step 5/5: Compiling PDF...", tag)
+        async with self.compile_slots:
+            try:
+                await compile_pdf(job_dir)
+            except subprocess.CalledProcessError:
+                # Don't let the next run reuse a response that doesn't build
+                await asyncio.to_thread(discard_cached_resume, job, self.base_resume)
+                raise
 
-    print("\n" + "="*60)
-    print("🎯 PHASE 2: RESUME GENERATION")
-    print("="*60)
+        job_duration = time.time() - job_start_time
+        logger.info("✅ %s Completed in %.2f seconds", tag, job_duration)
 
-    for idx, job in enumerate(jobs, 1):
-        print(f"\n🔄 Processing job {idx}/{len(jobs)}: {job.get('title', 'Unknown')}")
-        print(f"🏢 Company: {job.get('company', 'Unknown')}")
-        print(f"📍 Location: {job.get('location', 'Unknown')}")
 
-        job_start_time = time.time()
-        job_dir = output_root / f"job_{idx}"
+async def generate_resumes(config_path: Path = CONFIG_PATH, output_root: Path = OUTPUT_ROOT) -> int:
+    """Run the whole pipeline and return the number of jobs that failed."""
+    logger.info("🚀 Starting resume generation pipeline...")
+    logger.info("📂 Config file: %s", config_path)
+    logger.info("📂 Output directory: %s", output_root)
 
-        # Step 1: Prepare directory
-        print(f"\n📁 Step 1/5: Preparing job directory...")
-        prepare_job_directory(job_dir)
+    start_time = time.time()
 
-        # Step 2: Write job summary
-        print(f"📝 Step 2/5: Writing job summary...")
-        write_job_summary(job, job_dir)
+    logger.info("\n%s\n📡 PHASE 1: JOB SCRAPING\n%s", "="*60, "="*60)
 
-        # Step 3: Tailor resume with AI
-        print(f"🤖 Step 3/5: Tailoring resume with AI...")
-        tailored = tailor_resume(job, job_dir / "resume.tex")
+    jobs = await asyncio.to_thread(scrape_jobs, config_path)
+    logger.info("\n✅ Job scraping completed! Found %d jobs to process", len(jobs))
 
-        # Step 4: Save tailored resume
-        print(f"💾 Step 4/5: Saving tailored resume...")
-        tailored_file = job_dir / "resume.tex"
-        tailored_file.write_text(tailored, encoding="utf-8")
-        print(f"💾 Tailored resume saved to: {tailored_file}")
+    if not jobs:
+        logger.warning("⚠️ No jobs found. Exiting...")
+        return 0
 
-        # Step 5: Compile PDF
-        print(f"🔧 Step 5/5: Compiling PDF...")
-        compile_pdf(job_dir)
+    output_root.mkdir(exist_ok=True)
 
-        job_duration = time.time() - job_start_time
-        print(f"✅ Job {idx} completed in {job_duration:.2f} seconds")
+    logger.info("\n%s\n🎯 PHASE 2: RESUME GENERATION\n%s", "="*60, "="*60)
+
+    # The base resume is identical for every job, so read it only once
+    base_resume = (LATEX_SRC / "resume.tex").read_text(encoding="utf-8")
+
+    # Jobs run concurrently
+    pipeline = _ResumePipeline(base_resume, output_root, len(jobs))
+    results = await asyncio.gather(
+        *(pipeline.process_job(idx, job) for idx, job in enumerate(jobs, 1)),
+        return_exceptions=True,
+    )
 
-        # Add a small delay between jobs to respect API limits
-        if idx < len(jobs):
-            print("⏳ Waiting 5 seconds before next job...")
-            time.sleep(5)
+    failures = [(idx, res) for idx, res in enumerate(results, 1) if isinstance(res, BaseException)]
+    for idx, error in failures:
+        logger.error("❌ Job %d failed: %s", idx, error, exc_info=error)
 
     total_duration = time.time() - start_time
-    print("\n" + "="*60)
-    print("🎉 PIPELINE COMPLETED!")
-    print("="*60)
-    print(f"📊 Total jobs processed: {len(jobs)}")
-    print(f"⏱️ Total time: {total_duration:.2f} seconds")
-    print(f"📂 Output location: {output_root}")
-    print("="*60)
+    logger.info("\n%s\n🎉 PIPELINE COMPLETED!\n%s", "="*60, "="*60)
+    logger.info("📊 Total jobs processed: %d/%d", len(jobs) - len(failures), len(jobs))
+    logger.info("⏱️ Total time: %.2f seconds", total_duration)
+    logger.info("📂 Output location: %s", output_root)
+    logger.info("="*60)
+    return len(failures)
 
 
 if __name__ == "__main__":
-    generate_resumes()
+    setup_logging()
+    if asyncio.run(generate_resumes()):
+        sys.exit(1)
@@ -7,15 +7,35 @@ CSS selectors. Supports individual job page extraction, pagination, and infinite
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
 import time
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urljoin, urlparse, urlsplit
 
 import yaml
 import requests
-from bs4 import BeautifulSoup
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+import soupsieve
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, Tag
+from bs4.dammit import EncodingDetector
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
+
+# lxml is a C parser and much faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 # Selenium imports for infinite scroll
 try:
@@ -31,118 +51,578 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Extracts the configured fields from a parsed element: (element, base_url) -> job
+Extractor = Callable[[Tag, str], Dict[str, Any]]
+
+# Preprocessed skill filters: (lowercased name, required) in config order
+SkillRules = Tuple[Tuple[str, bool], ...]
+# Decides whether a job's text (any case) satisfies the skill filters
+SkillMatcher = Callable[[str], bool]
+
+# Maximum number of sites scraped at the same time
+MAX_SITE_WORKERS = 8
+# Default number of detail pages fetched at the same time for one site
+DETAIL_CONCURRENCY = 8
+# Number of processes parsing detail pages
+PARSE_WORKERS = os.cpu_count() or 1
+# Default number of list pages fetched at the same time for ``page_param`` sites
+PAGE_CONCURRENCY = 5
+# Extracted detail-page fields are cached here keyed by URL and selectors, so
+# jobs seen on a previous run are not fetched again.
+DETAIL_CACHE_DIR = Path(__file__).resolve().parents[1] / "outputs" / ".cache" / "details"
+# Default lifetime of a cached detail page in seconds (site ``detail_cache_ttl``,
+# 0 disables the cache)
+DETAIL_CACHE_TTL = 24 * 60 * 60
+# Default minimum delay in seconds between two requests to the same host
+# (site ``min_interval``, 0 disables throttling)
+MIN_REQUEST_INTERVAL = 0.5
+
+_SALARY_RE = re.compile(r"(\d+[\.,]?\d*)")
+# BRL is checked first since "R$" also contains "$"
+_BRL_RE = re.compile(r"R\$|BRL")
+_USD_RE = re.compile(r"\$|USD")
+# Drops thousands separators and turns a decimal comma into a point
+_AMOUNT_TRANS = str.maketrans({".": None, ",": "."})
+# Optional "@directive" at the end of a field selector, see _parse_field_spec
+_FIELD_DIRECTIVE_RE = re.compile(r"^(?:(.*?)\s+)?@(text|string|href|attr:[\w:.-]+)\s*$")
+# Job fields searched for the configured skills, in haystack order
+_SKILL_TEXT_FIELDS = ("skills", "description", "title")
+_PAGE_NUMBER_RE = re.compile(r"\d+")
+# Encoding assumed for pages that don't declare one (the HTML5 default)
+DEFAULT_ENCODING = "utf-8"
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Returns the number of job cards and the outer HTML of those after the
+# first arguments[1] ones
+_NEW_CARDS_JS = """
+const cards = document.querySelectorAll(arguments[0]);
+return [cards.length, Array.from(cards).slice(arguments[1]).map(card => card.outerHTML)];
+"""
+# Wrapper elements the parser adds around an HTML fragment
+_DOCUMENT_TAGS = frozenset(("html", "head", "body"))
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+class _HostThrottle:
+    """Space out requests to the same host by at least a minimum interval.
+
+    Each host has its own next free slot, so a slow site never delays
+    requests to another one. Slots are reserved under the lock but slept
+    outside it, so concurrent workers queue up without blocking each other.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, url: str, interval: float) -> None:
+        if interval <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_host_throttle = _HostThrottle()
+
+
+def _get_session() -> requests.Session:
+    """Return the HTTP session shared by every worker thread.
+
+    Sessions keep connections alive, so list and detail pages on the same
+    host reuse TCP/TLS connections. One session serves all threads: the
+    urllib3 connection pool behind it is thread-safe, and per-thread
+    sessions would open fresh connections for every short-lived worker.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                # Enough connections for every site worker's detail fetches
+                pool_maxsize=MAX_SITE_WORKERS * DETAIL_CONCURRENCY,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
 
 def _parse_salary(text: str) -> tuple[str, float]:
     """Return currency code and amount extracted from *text*."""
     if not text:
         return "", 0.0
     currency = ""
-    if "R$" in text or "BRL" in text:
+    if _BRL_RE.search(text):
         currency = "BRL"
-    elif "$" in text or "USD" in text:
+    elif _USD_RE.search(text):
         currency = "USD"
-    match = re.search(r"(\d+[\.,]?\d*)", text)
+    match = _SALARY_RE.search(text)
     if not match:
         return currency, 0.0
-    amount = float(match.group(1).replace(".", "").replace(",", "."))
+    amount = float(match.group(1).translate(_AMOUNT_TRANS))
     return currency, amount
 
 
-def _get_page_content(url: str, headers: Optional[Dict[str, str]] = None) -> BeautifulSoup:
-    """Get and parse page content with error handling."""
-    default_headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    if headers:
-        default_headers.update(headers)
+def _declared_encoding(response: requests.Response) -> str:
+    """Return the charset declared by *response*, defaulting to UTF-8.
 
-    response = requests.get(url, headers=default_headers, timeout=30)
+    The ``Content-Type`` header wins, then a ``<meta>`` declaration near the
+    top of the document. Only that prefix is scanned, unlike the whole-body
+    detection bs4 falls back to when no encoding is given.
+    """
+    match = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    if match:
+        return match.group(1)
+    declared = EncodingDetector.find_declared_encoding(response.content, is_html=True)
+    return declared or DEFAULT_ENCODING
+
+
+def _fetch_page(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    encoding: Optional[str] = None,
+    min_interval: float = 0.0,
+) -> Tuple[bytes, str]:
+    """Download *url* and return its raw body and encoding.
+
+    Requests to the same host are spaced out by *min_interval* seconds. The
+    raw body is used instead of ``response.text``, which would first run
+    requests' charset detection over the whole page. The encoding comes from
+    *encoding* (a site's ``encoding`` setting), else the one the page
+    declares, so the parser never has to guess it.
+    """
+    _host_throttle.wait(url, min_interval)
+    response = _get_session().get(url, headers=headers, timeout=30)
     response.raise_for_status()
-    return BeautifulSoup(response.text, "html.parser")
-
-
-def _extract_job_data(soup: BeautifulSoup, fields: Dict[str, str], base_url: str = "") -> Dict[str, Any]:
-    """Extract job data from a soup object using field selectors."""
-    job: Dict[str, Any] = {}
-    for field, selector in fields.items():
-        target = soup.select_one(selector)
-        if target:
-            if field == "link" and target.get("href"):
-                # Handle relative URLs
-                job[field] = urljoin(base_url, target.get("href"))
+    if not encoding:
+        encoding = _declared_encoding(response)
+    return response.content, encoding
+
+
+def _get_page_content(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    encoding: Optional[str] = None,
+    min_interval: float = 0.0,
+) -> BeautifulSoup:
+    """Get and parse page content with error handling."""
+    content, encoding = _fetch_page(url, headers, encoding, min_interval)
+    return BeautifulSoup(content, HTML_PARSER, from_encoding=encoding)
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the process pool used to parse detail pages, starting it once.
+
+    Parsing is CPU-bound and holds the GIL, so parsing in the fetching
+    threads would stall the other downloads. ``forkserver`` is preferred
+    since forking a process that already runs threads is unsafe.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+            _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=context)
+        return _parse_pool
+
+
+def _shutdown_parse_pool() -> None:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown()
+            _parse_pool = None
+
+
+def _parse_and_extract(
+    content: bytes, fields: Tuple[Tuple[str, str], ...], base_url: str, encoding: Optional[str]
+) -> Dict[str, Any]:
+    """Parse a page and extract *fields* from it; runs in the parse pool.
+
+    Only picklable values cross the process boundary; each worker compiles
+    the selectors once through the extractor cache.
+    """
+    soup = BeautifulSoup(content, HTML_PARSER, from_encoding=encoding)
+    return _make_extractor(fields)(soup, base_url)
+
+
+@lru_cache(maxsize=256)
+def _url_origin(base_url: str) -> Optional[Tuple[str, str]]:
+    """Return ``(scheme, "scheme://netloc")`` of *base_url*, or ``None``."""
+    parts = urlsplit(base_url)
+    if not parts.scheme or not parts.netloc:
+        return None
+    return parts.scheme, f"{parts.scheme}://{parts.netloc}"
+
+
+def _join(base_url: str, href: str) -> str:
+    """Resolve *href* against *base_url* like ``urljoin``, but faster.
+
+    Absolute, protocol-relative and path-absolute links are built by string
+    concatenation against the cached origin of *base_url*; anything else
+    (relative paths, dot segments) goes through ``urljoin``.
+    """
+    if "/." not in href:
+        if href.startswith(("https://", "http://")):
+            return href
+        origin = _url_origin(base_url)
+        if origin is not None and href.startswith("/"):
+            scheme, prefix = origin
+            return f"{scheme}:{href}" if href.startswith("//") else prefix + href
+    return urljoin(base_url, href)
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once and reuse it for every page and element."""
+    return soupsieve.compile(selector)
+
+
+def _parse_field_spec(field: str, spec: str) -> Tuple[str, str, Optional[str]]:
+    """Split a field setting into ``(selector, mode, attribute)``.
+
+    A trailing directive picks what is read from the matched element:
+    ``@text`` (all descendant text), ``@string`` (its single text node),
+    ``@href`` (the resolved link) or ``@attr:<name>``. A directive on its
+    own (e.g. ``"@attr:data-id"``) reads the job card itself and yields an
+    empty selector. Without a directive, the ``link`` field reads the
+    resolved ``href`` (falling back to the text) and every other field
+    reads the text.
+    """
+    match = _FIELD_DIRECTIVE_RE.match(spec)
+    if match is None:
+        return spec, "link" if field == "link" else "text", None
+    selector, directive = match.groups()
+    mode, _, attribute = directive.partition(":")
+    return selector or "", mode, attribute or None
+
+
+@lru_cache(maxsize=None)
+def _make_extractor(fields: Tuple[Tuple[str, str], ...]) -> Extractor:
+    """Build an extraction function specialised for one field configuration.
+
+    Selectors are compiled and field directives are resolved once here, so
+    the returned function only evaluates compiled selectors per job card.
+    Fields sharing a selector are grouped so each distinct selector walks
+    the card only once. Sites sharing the same configuration share the same
+    extractor.
+    """
+    grouped: Dict[str, List[Tuple[str, str, Optional[str]]]] = {}
+    for field, spec in fields:
+        selector, mode, attribute = _parse_field_spec(field, spec)
+        grouped.setdefault(selector, []).append((field, mode, attribute))
+    plan = tuple(
+        (_compile_selector(selector) if selector else None, tuple(targets))
+        for selector, targets in grouped.items()
+    )
+    # Without shared selectors the fields are already filled in config order
+    field_order = tuple(field for field, _ in fields) if len(plan) < len(fields) else None
+
+    def extract(soup: Tag, base_url: str = "") -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for selector, targets in plan:
+            # The card itself can be the target, as when the whole card is a link
+            if selector is None or selector.match(soup):
+                target = soup
             else:
-                job[field] = target.get_text(strip=True)
-        else:
-            job[field] = None
-    return job
+                target = selector.select_one(soup)
+            for field, mode, attribute in targets:
+                if target is None:
+                    values[field] = None
+                elif mode == "attr":
+                    value = target.get(attribute)
+                    # Multi-valued attributes such as class come back as lists
+                    values[field] = " ".join(value) if isinstance(value, list) else value
+                elif mode == "href" or (mode == "link" and target.get("href")):
+                    href = target.get("href")
+                    # Handle relative URLs
+                    values[field] = _join(base_url, href) if href else None
+                elif mode == "string" and target.string is not None:
+                    values[field] = target.string.strip()
+                else:
+                    values[field] = target.get_text(strip=True)
+        if field_order is None:
+            return values
+        return {field: values[field] for field in field_order}
 
+    return extract
 
-def _scrape_individual_job(job_url: str, detail_fields: Dict[str, str]) -> Dict[str, Any]:
-    """Scrape detailed information from an individual job page."""
+
+def _site_extractor(fields: Optional[Dict[str, str]]) -> Extractor:
+    """Return the cached extractor for a ``fields``/``detail_fields`` mapping."""
+    return _make_extractor(tuple((fields or {}).items()))
+
+
+def _scrape_individual_job(
+    job_url: str,
+    detail_fields: Dict[str, str],
+    encoding: Optional[str] = None,
+    min_interval: float = 0.0,
+) -> Dict[str, Any]:
+    """Scrape detailed information from an individual job page.
+
+    The page is downloaded in the calling thread and parsed in the parse
+    pool.
+    """
     try:
-        soup = _get_page_content(job_url)
-        return _extract_job_data(soup, detail_fields, job_url)
+        content, encoding = _fetch_page(job_url, encoding=encoding, min_interval=min_interval)
+        future = _get_parse_pool().submit(
+            _parse_and_extract, content, tuple(detail_fields.items()), job_url, encoding
+        )
+        return future.result()
     except Exception as e:
-        print(f"Error scraping job details from {job_url}: {e}")
+        logger.warning("Error scraping job details from %s: %s", job_url, e)
         return {}
 
 
-def _check_skills_match(job_text: str, skills_config: List[Any]) -> bool:
-    """Check if job matches skill requirements based on configuration."""
-    job_text_lower = job_text.lower()
+def _link_key(link: str, ignore_query: bool = False) -> str:
+    """Return the identity of a job *link* used for dedupe and caching.
 
+    The fragment never selects a different page, so it is always dropped.
+    With *ignore_query* (site ``ignore_link_query``) the query is dropped
+    too, for sites such as LinkedIn that append per-search tracking
+    parameters to the same job URL.
+    """
+    parts = urlsplit(link)
+    return parts._replace(query="" if ignore_query else parts.query, fragment="").geturl()
+
+
+def _detail_cache_path(link_key: str, detail_fields: Dict[str, str]) -> Path:
+    # The extracted values depend on the selectors, so they are part of the key
+    key = hashlib.sha256(
+        json.dumps([link_key, detail_fields], sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return DETAIL_CACHE_DIR / f"{key}.json"
+
+
+def _prune_detail_cache(max_age: float) -> None:
+    """Delete cached detail pages (and leftover temp files) older than *max_age* seconds.
+
+    Nothing is deleted when *max_age* is not positive (no sites, or the cache
+    disabled everywhere), so a run that doesn't use the cache keeps it intact.
+    """
+    if max_age <= 0:
+        return
+    try:
+        entries = list(DETAIL_CACHE_DIR.iterdir())
+    except OSError:
+        return  # No cache yet
+    now = time.time()
+    removed = 0
+    for entry in entries:
+        try:
+            if now - entry.stat().st_mtime >= max_age:
+                entry.unlink()
+                removed += 1
+        except OSError:
+            pass  # Removed concurrently or not a regular file
+    if removed:
+        logger.debug("Removed %d expired detail cache entries", removed)
+
+
+def _load_job_details(
+    job_url: str,
+    detail_fields: Dict[str, str],
+    ttl: float,
+    encoding: Optional[str] = None,
+    min_interval: float = 0.0,
+    link_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return the detail fields of *job_url*, from the cache when fresh.
+
+    Entries are stored under *link_key* (defaults to *job_url*). Failed
+    fetches are not cached, so they are retried on the next run.
+    """
+    cache_file = _detail_cache_path(link_key or job_url, detail_fields)
+    if ttl > 0:
+        try:
+            if time.time() - cache_file.stat().st_mtime < ttl:
+                with cache_file.open("r", encoding="utf-8") as fh:
+                    return json.load(fh)
+        except (OSError, ValueError):
+            pass  # Missing or unreadable entry: fetch the page again
+
+    details = _scrape_individual_job(job_url, detail_fields, encoding, min_interval)
+    if details and ttl > 0:
+        try:
+            # Write then rename so concurrent workers never read a partial file
+            DETAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=DETAIL_CACHE_DIR, suffix=".tmp", delete=False
+            ) as tmp_file:
+                json.dump(details, tmp_file, ensure_ascii=False)
+            os.replace(tmp_file.name, cache_file)
+        except OSError as e:
+            logger.warning("Could not cache job details for %s: %s", job_url, e)
+    return details
+
+
+def _scrape_details_batch(jobs: List[Dict[str, Any]], site: Dict[str, Any]) -> None:
+    """Merge detail-page fields into every job of *jobs* that has a link.
+
+    Detail pages are fetched concurrently, at most ``detail_concurrency``
+    (site setting) at a time, instead of one after another. Each distinct
+    link is loaded once, and pages cached within ``detail_cache_ttl``
+    seconds are not fetched at all.
+    """
+    targets = [job for job in jobs if job.get("link")]
+    if not targets:
+        return
+
+    ignore_query = site.get("ignore_link_query", False)
+    # First URL seen for each distinct link key
+    links: Dict[str, str] = {}
+    for job in targets:
+        links.setdefault(_link_key(job["link"], ignore_query), job["link"])
+    logger.debug("Scraping details for %d jobs...", len(links))
+    concurrency = site.get("detail_concurrency", DETAIL_CONCURRENCY)
+    detail_fields = site.get("detail_fields") or {}
+    ttl = site.get("detail_cache_ttl", DETAIL_CACHE_TTL)
+    encoding = site.get("encoding")
+    min_interval = site.get("min_interval", MIN_REQUEST_INTERVAL)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(links))) as executor:
+        details = dict(zip(links, executor.map(
+            lambda item: _load_job_details(
+                item[1], detail_fields, ttl, encoding, min_interval, item[0]
+            ),
+            links.items(),
+        )))
+    for job in targets:
+        job.update(details[_link_key(job["link"], ignore_query)])  # Merge detailed info
+
+
+def _prepare_skills(skills_config: List[Any]) -> SkillRules:
+    """Lowercase the configured skills once per run.
+
+    Each entry becomes ``(name, required)``. Plain strings (old format) are
+    optional skills, exactly like ``{"name": ..., "required": false}``.
+    """
+    rules = []
     for skill_entry in skills_config:
         if isinstance(skill_entry, str):
-            # Old format: just a string (optional skill)
-            if skill_entry.lower() in job_text_lower:
-                return True
+            rules.append((skill_entry.lower(), False))
         elif isinstance(skill_entry, dict):
-            # New format: dict with skill and required flag
-            skill_name = skill_entry.get("name", "").lower()
-            is_required = skill_entry.get("required", False)
+            rules.append((skill_entry.get("name", "").lower(), bool(skill_entry.get("required", False))))
+    return tuple(rules)
+
 
-            skill_found = skill_name in job_text_lower
+def _check_skills_match(job_text_lower: str, skill_rules: SkillRules) -> bool:
+    """Check if job matches skill requirements based on configuration.
 
-            if is_required and not skill_found:
+    Skills are checked in configuration order: a missing required skill
+    rejects the job and a present optional skill accepts it. If neither
+    happens, the job matches only when there are required skills (all of
+    which were then found).
+    """
+    has_required_skills = False
+    for skill_name, is_required in skill_rules:
+        skill_found = skill_name in job_text_lower
+        if is_required:
+            if not skill_found:
                 # Required skill not found, job doesn't match
                 return False
-            elif not is_required and skill_found:
-                # Optional skill found, job matches
-                return True
-
-    # If we have any required skills, at least one must be found
-    has_required_skills = any(
-        isinstance(skill, dict) and skill.get("required", False)
-        for skill in skills_config
-    )
+            has_required_skills = True
+        elif skill_found:
+            # Optional skill found, job matches
+            return True
+    return has_required_skills
+
+
+def _make_skill_matcher(skills_config: List[Any]) -> Optional[SkillMatcher]:
+    """Build the skill filter for one run, or ``None`` when no skills are configured.
+
+    The configuration is preprocessed once, and results are memoized by
+    text since the same listing often shows up on several pages and sites.
+    """
+    skill_rules = _prepare_skills(skills_config)
+    if not skill_rules:
+        return None
+
+    @lru_cache(maxsize=4096)
+    def match(text: str) -> bool:
+        return _check_skills_match(text.lower(), skill_rules)
 
-    if has_required_skills:
-        # Check if at least one required skill was found
-        for skill_entry in skills_config:
-            if isinstance(skill_entry, dict) and skill_entry.get("required", False):
-                if skill_entry.get("name", "").lower() in job_text_lower:
-                    return True
-        return False
-
-    # If no required skills and no optional skills found, check old format
-    return any(
-        isinstance(skill, str) and skill.lower() in job_text_lower
-        for skill in skills_config
+    return match
+
+
+def _matches_skills(job: Dict[str, Any], match_skills: Optional[SkillMatcher]) -> bool:
+    """Return ``True`` if the text fields of *job* satisfy the skill filters."""
+    if match_skills is None:
+        return True  # No filters: skip building the text
+    return match_skills(" ".join(filter(None, [job.get(field) for field in _SKILL_TEXT_FIELDS])))
+
+
+def _meets_salary(job: Dict[str, Any], min_usd: Optional[float], min_brl: Optional[float]) -> bool:
+    """Return ``True`` unless *job* states a salary below the threshold for its currency."""
+    cur, amount = _parse_salary(job.get("salary", ""))
+    return not (
+        (cur == "USD" and min_usd and amount < min_usd)
+        or (cur == "BRL" and min_brl and amount < min_brl)
     )
 
 
+def _passes_filters(
+    job: Dict[str, Any],
+    match_skills: Optional[SkillMatcher],
+    min_usd: Optional[float],
+    min_brl: Optional[float],
+) -> bool:
+    """Return ``True`` if *job* satisfies the skill and salary filters."""
+    return _matches_skills(job, match_skills) and _meets_salary(job, min_usd, min_brl)
+
+
+def _rejected_before_detail(
+    job: Dict[str, Any],
+    detail_fields: Dict[str, str],
+    match_skills: Optional[SkillMatcher],
+    min_usd: Optional[float],
+    min_brl: Optional[float],
+) -> bool:
+    """Return ``True`` if *job* fails the filters whatever its detail page holds.
+
+    A filter can only be decided from the listing when none of the fields it
+    reads are (re)filled from the detail page.
+    """
+    if set(detail_fields).isdisjoint(_SKILL_TEXT_FIELDS) and not _matches_skills(job, match_skills):
+        return True
+    return "salary" not in detail_fields and not _meets_salary(job, min_usd, min_brl)
+
+
 def _get_next_page_url(soup: BeautifulSoup, base_url: str, pagination_config: Dict[str, Any]) -> Optional[str]:
     """Get the next page URL based on pagination configuration."""
     if pagination_config.get("type") == "next_button":
         next_selector = pagination_config.get("next_selector", "")
-        next_link = soup.select_one(next_selector)
+        next_link = _compile_selector(next_selector).select_one(soup)
         if next_link and next_link.get("href"):
             return urljoin(base_url, next_link.get("href"))
 
     elif pagination_config.get("type") == "numbered_links":
         # For numbered links, we need to track current page and get next
         links_selector = pagination_config.get("links_selector", "")
-        page_links = soup.select(links_selector)
+        page_links = _compile_selector(links_selector).select(soup)
 
         # Find current active page and get next one
         for i, link in enumerate(page_links):
@@ -160,28 +640,28 @@ def _get_next_page_url(soup: BeautifulSoup, base_url: str, pagination_config: Di
 def _setup_selenium_driver() -> Optional[webdriver.Chrome]:
     """Setup Chrome driver for infinite scroll support."""
     if not SELENIUM_AVAILABLE:
-        print("Selenium not available. Install with: pip install selenium webdriver-manager")
+        logger.warning("Selenium not available. Install with: pip install selenium webdriver-manager")
         return None
 
     try:
-        print("Setting up Chrome driver for Docker environment...")
+        logger.info("Setting up Chrome driver for Docker environment...")
 
         # Check if Chrome and ChromeDriver are available
         import subprocess
         try:
             chrome_version = subprocess.run(["/usr/bin/google-chrome", "--version"],
                                           capture_output=True, text=True, check=True)
-            print(f"Chrome version: {chrome_version.stdout.strip()}")
+            logger.debug("Chrome version: %s", chrome_version.stdout.strip())
         except Exception as e:
-            print(f"Chrome binary not found: {e}")
+            logger.warning("Chrome binary not found: %s", e)
             return None
 
         try:
             driver_version = subprocess.run(["/usr/local/bin/chromedriver", "--version"],
                                           capture_output=True, text=True, check=True)
-            print(f"ChromeDriver version: {driver_version.stdout.strip()}")
+            logger.debug("ChromeDriver version: %s", driver_version.stdout.strip())
         except Exception as e:
-            print(f"ChromeDriver binary not found: {e}")
+            logger.warning("ChromeDriver binary not found: %s", e)
             return None
 
         options = Options()
@@ -230,37 +710,61 @@ def _setup_selenium_driver() -> Optional[webdriver.Chrome]:
         # Use system chromedriver
         service = Service("/usr/local/bin/chromedriver")
 
-        print("Attempting to create Chrome driver instance...")
+        logger.debug("Attempting to create Chrome driver instance...")
         driver = webdriver.Chrome(service=service, options=options)
-        print("✅ Chrome driver successfully created!")
+        logger.info("✅ Chrome driver successfully created!")
         return driver
     except Exception as e:
-        print(f"Failed to setup Chrome driver: {e}")
-        print(f"Error type: {type(e).__name__}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to setup Chrome driver (%s): %s", type(e).__name__, e)
         return None
 
 
-def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Dict[str, Any]]:
-    """Scrape jobs from a site that uses infinite scroll (like LinkedIn)."""
-    if not SELENIUM_AVAILABLE:
-        print("Selenium not available for infinite scroll. Falling back to regular scraping.")
-        return []
+def _parse_fragment(html: str) -> Optional[Tag]:
+    """Parse the outer HTML of one element and return that element."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    return soup.find(lambda tag: tag.name not in _DOCUMENT_TAGS)
 
-    driver = _setup_selenium_driver()
-    if not driver:
+
+def _parse_fragments(fragments: List[str]) -> List[Tag]:
+    """Parse the outer HTML of several sibling elements in a single pass.
+
+    Elements the parser cannot keep at the top level (e.g. table rows
+    outside a table) get reshuffled; the fragments are then parsed one by
+    one instead.
+    """
+    if not fragments:
         return []
+    soup = BeautifulSoup("".join(fragments), HTML_PARSER)
+    root = soup.body or soup
+    elements = root.find_all(True, recursive=False)
+    if len(elements) == len(fragments):
+        return elements
+    return [card for card in map(_parse_fragment, fragments) if card is not None]
+
 
+def _scrape_with_infinite_scroll(
+    site: Dict[str, Any], max_jobs: int, driver: webdriver.Chrome
+) -> List[Dict[str, Any]]:
+    """Scrape jobs from a site that uses infinite scroll (like LinkedIn).
+
+    *driver* is shared by all infinite-scroll sites of a run; it is reset
+    after each site but only quit by the caller.
+    """
     try:
         url = site["url"]
-        print(f"Loading {url} with Selenium for infinite scroll...")
+        job_selector = _compile_selector(site.get("job_selector", ""))
+        extract_fields = _site_extractor(site.get("fields"))
+        logger.debug("Loading %s with Selenium for infinite scroll...", url)
         driver.get(url)
 
         # Wait for initial content to load
         time.sleep(3)
 
         jobs = []
+        seen_links: set[str] = set()
+        ignore_query = site.get("ignore_link_query", False)
+        cards_read = 0  # Job cards already handled, in document order
+        read_delta = True
         last_job_count = 0
         no_new_content_attempts = 0
         max_no_new_content_attempts = 3
@@ -283,7 +787,7 @@ def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Di
                     try:
                         close_button = driver.find_element(By.CSS_SELECTOR, selector)
                         if close_button.is_displayed():
-                            print("Found modal overlay, attempting to close...")
+                            logger.debug("Found modal overlay, attempting to close...")
                             close_button.click()
                             time.sleep(1)
                             break
@@ -298,38 +802,63 @@ def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Di
                 # Ignore errors when trying to close modals
                 pass
 
-            # Get current page content
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            job_elements = soup.select(site.get("job_selector", ""))
-
-            print(f"Found {len(job_elements)} total job listings on page")
-
-            # Process new jobs (skip already processed ones)
-            for i, elem in enumerate(job_elements[len(jobs):]):
-                if len(jobs) >= max_jobs:
+            # Only the cards rendered since the last pass are transferred and
+            # parsed; the whole page is read only if the browser rejects the
+            # selector (e.g. soupsieve-only syntax)
+            new_elements: List[Tag] = []
+            if read_delta:
+                try:
+                    total_cards, fragments = driver.execute_script(
+                        _NEW_CARDS_JS, site.get("job_selector", ""), cards_read
+                    )
+                    new_elements = _parse_fragments(fragments)
+                except Exception:
+                    read_delta = False
+            if not read_delta:
+                soup = BeautifulSoup(driver.page_source, HTML_PARSER)
+                job_elements = job_selector.select(soup)
+                total_cards = len(job_elements)
+                new_elements = job_elements[cards_read:]
+            cards_read = total_cards
+
+            logger.debug("Found %d total job listings on page", total_cards)
+
+            # Process new jobs
+            new_jobs = []
+            for elem in new_elements:
+                if len(jobs) + len(new_jobs) >= max_jobs:
                     break
 
-                job_soup = BeautifulSoup(str(elem), "html.parser")
-                job = _extract_job_data(job_soup, site.get("fields", {}), url)
+                job = extract_fields(elem, url)
 
-                # Skip if no link found
-                if not job.get("link"):
+                # Skip if no link found or the job was already collected
+                link = job.get("link")
+                if not link:
                     continue
+                link_key = _link_key(link, ignore_query)
+                if link_key in seen_links:
+                    continue
+                seen_links.add(link_key)
+                new_jobs.append(job)
 
-                # Extract individual job details if configured
-                if job.get("link") and site.get("detail_fields"):
-                    print(f"Scraping details for: {job.get('title', 'Unknown title')}")
-                    detailed_job = _scrape_individual_job(job["link"], site["detail_fields"])
-                    job.update(detailed_job)
-                    time.sleep(0.5)
+            # Extract individual job details if configured
+            if site.get("detail_fields"):
+                _scrape_details_batch(new_jobs, site)
 
+            for job in new_jobs:
                 jobs.append(job)
-                print(f"✓ Job {len(jobs)}/{max_jobs} collected: {job.get('title', 'Unknown title')}")
+                logger.debug(
+                    "✓ Job %d/%d collected: %s", len(jobs), max_jobs, job.get("title", "Unknown title")
+                )
 
             # Check if we got new jobs in this iteration
             if len(jobs) == last_job_count:
                 no_new_content_attempts += 1
-                print(f"No new jobs found. Attempt {no_new_content_attempts}/{max_no_new_content_attempts}")
+                logger.debug(
+                    "No new jobs found. Attempt %d/%d",
+                    no_new_content_attempts,
+                    max_no_new_content_attempts,
+                )
             else:
                 no_new_content_attempts = 0  # Reset counter if we found new jobs
 
@@ -337,12 +866,12 @@ def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Di
 
             # If we've reached max jobs, stop
             if len(jobs) >= max_jobs:
-                print(f"Reached maximum jobs limit ({max_jobs})")
+                logger.info("Reached maximum jobs limit (%d)", max_jobs)
                 break
 
             # If we haven't found new content for several attempts, stop
             if no_new_content_attempts >= max_no_new_content_attempts:
-                print("No new content found after multiple attempts. Stopping.")
+                logger.info("No new content found after multiple attempts. Stopping.")
                 break
 
             # Try to find and click "Ver mais vagas" button first
@@ -362,7 +891,7 @@ def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Di
                         show_more_button = driver.find_element(By.CSS_SELECTOR, selector)
 
                         if show_more_button.is_displayed() and show_more_button.is_enabled():
-                            print(f"Found 'Ver mais vagas' button with selector: {selector}")
+                            logger.debug("Found 'Ver mais vagas' button with selector: %s", selector)
 
                             # Scroll to button to ensure it's in view
                             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", show_more_button)
@@ -372,14 +901,14 @@ def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Di
                             try:
                                 # Method 1: Regular click
                                 show_more_button.click()
-                                print("✓ Button clicked with regular click")
+                                logger.debug("✓ Button clicked with regular click")
                                 button_clicked = True
                                 break
                             except Exception:
                                 try:
                                     # Method 2: JavaScript click
                                     driver.execute_script("arguments[0].click();", show_more_button)
-                                    print("✓ Button clicked with JavaScript")
+                                    logger.debug("✓ Button clicked with JavaScript")
                                     button_clicked = True
                                     break
                                 except Exception:
@@ -387,11 +916,11 @@ def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Di
                                         # Method 3: Action chains click
                                         from selenium.webdriver.common.action_chains import ActionChains
                                         ActionChains(driver).move_to_element(show_more_button).click().perform()
-                                        print("✓ Button clicked with ActionChains")
+                                        logger.debug("✓ Button clicked with ActionChains")
                                         button_clicked = True
                                         break
                                     except Exception as click_error:
-                                        print(f"All click methods failed for {selector}: {click_error}")
+                                        logger.warning("All click methods failed for %s: %s", selector, click_error)
                                         continue
                     except NoSuchElementException:
                         continue
@@ -401,11 +930,11 @@ def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Di
                     continue
 
             except Exception as e:
-                print(f"Error handling 'Ver mais vagas' button: {e}")
+                logger.warning("Error handling 'Ver mais vagas' button: %s", e)
 
             # If no button found or button click failed, try scrolling
             if not button_clicked:
-                print("Scrolling down to load more content...")
+                logger.debug("Scrolling down to load more content...")
                 last_height = driver.execute_script("return document.body.scrollHeight")
 
                 # Try multiple scroll approaches
@@ -420,169 +949,389 @@ def _scrape_with_infinite_scroll(site: Dict[str, Any], max_jobs: int) -> List[Di
                 # Check if scrolling loaded new content
                 new_height = driver.execute_script("return document.body.scrollHeight")
                 if new_height == last_height:
-                    print("Page height didn't change after scrolling")
+                    logger.debug("Page height didn't change after scrolling")
                     # Continue to let the no_new_content_attempts counter handle stopping
                 else:
-                    print(f"Page height changed from {last_height} to {new_height}")
+                    logger.debug("Page height changed from %d to %d", last_height, new_height)
 
-        print(f"Collected {len(jobs)} jobs with infinite scroll")
+        logger.info("Collected %d jobs with infinite scroll", len(jobs))
         return jobs
 
     except Exception as e:
-        print(f"Error during infinite scroll scraping: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error during infinite scroll scraping: %s", e)
         return []
     finally:
-        driver.quit()
-
+        # Leave the shared browser clean for the next site
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception:
+            pass
+
+
+def _iter_linked_pages(site: Dict[str, Any], max_pages: int) -> Iterator[Tuple[str, BeautifulSoup]]:
+    """Yield ``(url, soup)`` pages, following next-page links one at a time."""
+    current_url = site["url"]
+    min_interval = site.get("min_interval", MIN_REQUEST_INTERVAL)
+    for page_number in range(1, max_pages + 1):
+        logger.debug("Scraping page %d: %s", page_number, current_url)
+        try:
+            soup = _get_page_content(
+                current_url, encoding=site.get("encoding"), min_interval=min_interval
+            )
+        except Exception as e:
+            logger.warning("Error scraping page %s: %s", current_url, e)
+            return
+        yield current_url, soup
+
+        # Get next page URL if pagination is configured
+        if "pagination" not in site:
+            # No pagination configured, stop after first page
+            return
+        next_url = _get_next_page_url(soup, current_url, site["pagination"])
+        if not next_url or next_url == current_url:
+            logger.info("No more pages available")
+            return
+        current_url = next_url
+
+
+def _iter_template_pages(site: Dict[str, Any], max_pages: int) -> Iterator[Tuple[str, BeautifulSoup]]:
+    """Yield ``(url, soup)`` pages of a ``page_param`` site, in page order.
+
+    Page URLs come from the ``url_template`` pagination setting (with a
+    ``{page}`` placeholder, starting at ``first_page``). After the first page,
+    the page count is read from ``page_count_selector`` when configured and
+    the remaining pages are fetched concurrently, at most
+    ``page_concurrency`` (site setting) at a time. Pages stop at the first
+    one without job cards, and requests past it are cancelled.
+    """
+    pagination = site["pagination"]
+    template = pagination["url_template"]
+    first_page = pagination.get("first_page", 1)
+    job_selector = _compile_selector(site.get("job_selector", ""))
+    encoding = site.get("encoding")
+    min_interval = site.get("min_interval", MIN_REQUEST_INTERVAL)
+
+    url = template.format(page=first_page)
+    logger.debug("Scraping page 1: %s", url)
+    try:
+        soup = _get_page_content(url, encoding=encoding, min_interval=min_interval)
+    except Exception as e:
+        logger.warning("Error scraping page %s: %s", url, e)
+        return
+    if not job_selector.select_one(soup):
+        logger.info("No more pages available")
+        return
+    yield url, soup
+
+    page_total = max_pages
+    count_selector = pagination.get("page_count_selector")
+    if count_selector:
+        count_elem = _compile_selector(count_selector).select_one(soup)
+        numbers = _PAGE_NUMBER_RE.findall(count_elem.get_text()) if count_elem else []
+        if numbers:
+            page_total = min(page_total, int(numbers[-1]))
+
+    pages = range(first_page + 1, first_page + page_total)
+    if not pages:
+        return
+
+    concurrency = site.get("page_concurrency", PAGE_CONCURRENCY)
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, len(pages)))
+    futures = []
+    try:
+        for page in pages:
+            url = template.format(page=page)
+            futures.append((
+                url,
+                executor.submit(_get_page_content, url, encoding=encoding, min_interval=min_interval),
+            ))
+        for page_number, (url, future) in enumerate(futures, start=2):
+            logger.debug("Scraping page %d: %s", page_number, url)
+            try:
+                soup = future.result()
+            except Exception as e:
+                logger.warning("Error scraping page %s: %s", url, e)
+                return
+            if not job_selector.select_one(soup):
+                logger.info("No more pages available")
+                return
+            yield url, soup
+    finally:
+        # Pages not needed anymore (job limit reached, error) are not fetched
+        for _, future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
 
-def scrape_jobs(config_path: str | Path) -> List[Dict[str, Any]]:
-    """Scrape job listings defined in *config_path*.
 
-    The configuration must contain a ``sites`` list and may include ``skills``
-    keywords as well as ``salary`` thresholds in USD or BRL.
+def _iter_api_pages(site: Dict[str, Any], max_pages: int) -> Iterator[Tuple[str, BeautifulSoup]]:
+    """Yield ``(url, soup)`` pages of a site's ``api`` endpoint.
 
-    Enhanced to support individual job page extraction, pagination, and infinite scroll.
+    Infinite-scroll pages usually load more results from an endpoint that
+    returns plain HTML job cards (e.g. LinkedIn's ``seeMoreJobPostings``);
+    requesting it directly avoids running a browser. The endpoint ``url``
+    has a ``{start}`` placeholder, advanced by ``page_size`` (or by the
+    number of cards received) after each page until no cards come back.
     """
-    config_path = Path(config_path)
-    with config_path.open("r", encoding="utf-8") as fh:
-        config = yaml.safe_load(fh)
+    api = site["api"]
+    start = api.get("start", 0)
+    page_size = api.get("page_size")
+    headers = api.get("headers")
+    job_selector = _compile_selector(site.get("job_selector", ""))
+    min_interval = site.get("min_interval", MIN_REQUEST_INTERVAL)
+    for page_number in range(1, max_pages + 1):
+        url = api["url"].format(start=start)
+        logger.debug("Scraping page %d: %s", page_number, url)
+        try:
+            soup = _get_page_content(
+                url, headers=headers, encoding=site.get("encoding"), min_interval=min_interval
+            )
+        except Exception as e:
+            logger.warning("Error scraping page %s: %s", url, e)
+            return
+        card_count = len(job_selector.select(soup))
+        if not card_count:
+            logger.info("No more pages available")
+            return
+        yield url, soup
+        start += page_size or card_count
+
+
+def _scrape_paginated_site(
+    site: Dict[str, Any],
+    match_skills: Optional[SkillMatcher],
+    min_usd: Optional[float],
+    min_brl: Optional[float],
+) -> List[Dict[str, Any]]:
+    """Scrape a site using regular (request-based) pagination."""
+    max_jobs = site.get("max_jobs", 50)  # Default to 50 jobs per site
+    site_jobs: List[Dict[str, Any]] = []
+    max_pages = site.get("max_pages", 20)  # Safety limit to prevent infinite loops
+    job_selector = _compile_selector(site.get("job_selector", ""))
+    extract_fields = _site_extractor(site.get("fields"))
+    detail_fields = site.get("detail_fields") or {}
+    seen_links: set[str] = set()
+    ignore_query = site.get("ignore_link_query", False)
+
+    if "api" in site:
+        pages = _iter_api_pages(site, max_pages)
+    elif site.get("pagination", {}).get("type") == "page_param":
+        pages = _iter_template_pages(site, max_pages)
+    else:
+        pages = _iter_linked_pages(site, max_pages)
+
+    for page_url, soup in pages:
+        try:
+            # Extract job listings from current page
+            job_elements = job_selector.select(soup)
+            logger.debug("Found %d job listings on this page", len(job_elements))
+
+            # Extract basic job info and link, skipping listings already
+            # seen on a previous page
+            page_jobs = []
+            for elem in job_elements:
+                job = extract_fields(elem, page_url)
+                link = job.get("link")
+                if link:
+                    link_key = _link_key(link, ignore_query)
+                    if link_key in seen_links:
+                        continue
+                    seen_links.add(link_key)
+                page_jobs.append(job)
+
+            if detail_fields and site.get("filter_before_detail", True):
+                # Don't fetch detail pages of jobs the listing already rules out
+                page_jobs = [
+                    job
+                    for job in page_jobs
+                    if not _rejected_before_detail(job, detail_fields, match_skills, min_usd, min_brl)
+                ]
 
-    skills_config = config.get("skills", [])
-    salary_cfg = config.get("salary", {})
-    min_usd = salary_cfg.get("usd")
-    min_brl = salary_cfg.get("brl")
+            page_jobs_added = 0
+            next_job = 0
+            while next_job < len(page_jobs):
+                if len(site_jobs) >= max_jobs:
+                    logger.info("Reached maximum jobs limit (%d) for %s", max_jobs, site.get("name"))
+                    break
 
-    jobs: List[Dict[str, Any]] = []
+                # Only as many jobs as are still needed, so detail pages of
+                # jobs past the limit are never fetched
+                batch = page_jobs[next_job:next_job + max_jobs - len(site_jobs)]
+                next_job += len(batch)
+                if detail_fields:
+                    _scrape_details_batch(batch, site)
 
-    for site in config.get("sites", []):
-        print(f"Scraping {site.get('name', 'Unknown site')}...")
+                for job in batch:
+                    # Apply skill and salary filters
+                    if not _passes_filters(job, match_skills, min_usd, min_brl):
+                        continue
 
-        max_jobs = site.get("max_jobs", 50)  # Default to 50 jobs per site
+                    site_jobs.append(job)
+                    page_jobs_added += 1
+                    logger.debug(
+                        "✓ Job %d/%d added: %s", len(site_jobs), max_jobs, job.get("title", "Unknown title")
+                    )
 
-        # Check if this site uses infinite scroll
-        if site.get("pagination", {}).get("type") == "infinite_scroll":
-            print(f"Using infinite scroll for {site.get('name')}")
-            site_jobs = _scrape_with_infinite_scroll(site, max_jobs)
+            logger.debug("Added %d jobs from this page", page_jobs_added)
 
-            # Apply filters to scraped jobs
-            filtered_jobs = []
-            for job in site_jobs:
-                # Apply skill filters
-                haystack = " ".join(
-                    filter(None, [job.get("skills"), job.get("description"), job.get("title")])
-                )
+        except Exception as e:
+            logger.warning("Error scraping page %s: %s", page_url, e)
+            break
 
-                if skills_config and not _check_skills_match(haystack, skills_config):
-                    continue
+        # Check if we should continue to next page
+        if len(site_jobs) >= max_jobs:
+            logger.info("Reached target of %d jobs for %s", max_jobs, site.get("name"))
+            break
 
-                # Apply salary filters
-                cur, amount = _parse_salary(job.get("salary", ""))
-                if (
-                    (cur == "USD" and min_usd and amount < min_usd)
-                    or (cur == "BRL" and min_brl and amount < min_brl)
-                ):
-                    continue
+    pages.close()
+    logger.info("Total jobs collected from %s: %d", site.get("name"), len(site_jobs))
+    return site_jobs
 
-                filtered_jobs.append(job)
-                if len(filtered_jobs) >= max_jobs:
-                    break
 
-            jobs.extend(filtered_jobs)
-            print(f"Total filtered jobs from {site.get('name')}: {len(filtered_jobs)}")
+def _uses_infinite_scroll(site: Dict[str, Any]) -> bool:
+    # An ``api`` endpoint replaces the browser even for infinite-scroll sites
+    return "api" not in site and site.get("pagination", {}).get("type") == "infinite_scroll"
+
+
+def _scrape_one_site(
+    site: Dict[str, Any],
+    match_skills: Optional[SkillMatcher],
+    min_usd: Optional[float],
+    min_brl: Optional[float],
+    driver: Optional[webdriver.Chrome] = None,
+) -> List[Dict[str, Any]]:
+    """Scrape a single configured site and return its filtered jobs.
+
+    Infinite-scroll sites need a Selenium *driver*; without one they yield
+    no jobs. A misconfigured site (e.g. an invalid selector) is logged and
+    yields no jobs instead of aborting the other sites.
+    """
+    logger.info("Scraping %s...", site.get("name", "Unknown site"))
+    try:
+        return _scrape_site_jobs(site, match_skills, min_usd, min_brl, driver)
+    except Exception as e:
+        logger.warning("Error scraping %s: %s", site.get("name", "Unknown site"), e)
+        return []
+
+
+def _scrape_site_jobs(
+    site: Dict[str, Any],
+    match_skills: Optional[SkillMatcher],
+    min_usd: Optional[float],
+    min_brl: Optional[float],
+    driver: Optional[webdriver.Chrome],
+) -> List[Dict[str, Any]]:
+    if not _uses_infinite_scroll(site):
+        return _scrape_paginated_site(site, match_skills, min_usd, min_brl)
+
+    logger.info("Using infinite scroll for %s", site.get("name"))
+    if driver is None:
+        return []
+
+    max_jobs = site.get("max_jobs", 50)  # Default to 50 jobs per site
+    site_jobs = _scrape_with_infinite_scroll(site, max_jobs, driver)
+
+    # Apply filters to scraped jobs
+    filtered_jobs = []
+    for job in site_jobs:
+        if not _passes_filters(job, match_skills, min_usd, min_brl):
             continue
 
-        # Regular pagination scraping (existing logic)
-        site_jobs = []
-        current_url = site["url"]
-        page_count = 0
-        max_pages = site.get("max_pages", 20)  # Safety limit to prevent infinite loops
+        filtered_jobs.append(job)
+        if len(filtered_jobs) >= max_jobs:
+            break
 
-        while len(site_jobs) < max_jobs and page_count < max_pages:
-            page_count += 1
+    logger.info("Total filtered jobs from %s: %d", site.get("name"), len(filtered_jobs))
+    return filtered_jobs
 
-            try:
-                print(f"Scraping page {page_count}: {current_url}")
-                soup = _get_page_content(current_url)
-
-                # Extract job listings from current page
-                job_elements = soup.select(site.get("job_selector", ""))
-                print(f"Found {len(job_elements)} job listings on this page")
-
-                page_jobs_added = 0
-                for elem in job_elements:
-                    if len(site_jobs) >= max_jobs:
-                        print(f"Reached maximum jobs limit ({max_jobs}) for {site.get('name')}")
-                        break
-
-                    # Extract basic job info and link
-                    job_soup = BeautifulSoup(str(elem), "html.parser")
-                    job = _extract_job_data(job_soup, site.get("fields", {}), current_url)
-
-                    # If we have a job link and detail fields, scrape the individual page
-                    if job.get("link") and site.get("detail_fields"):
-                        print(f"Scraping details for: {job.get('title', 'Unknown title')}")
-                        detailed_job = _scrape_individual_job(job["link"], site["detail_fields"])
-                        job.update(detailed_job)  # Merge detailed info
-                        time.sleep(0.5)  # Be respectful to the server
-
-                    # Apply skill filters
-                    haystack = " ".join(
-                        filter(None, [job.get("skills"), job.get("description"), job.get("title")])
-                    )
 
-                    if skills_config and not _check_skills_match(haystack, skills_config):
-                        continue
+def _scrape_browser_sites(
+    sites: List[Dict[str, Any]],
+    match_skills: Optional[SkillMatcher],
+    min_usd: Optional[float],
+    min_brl: Optional[float],
+) -> List[List[Dict[str, Any]]]:
+    """Scrape infinite-scroll *sites* one after another with a single browser.
 
-                    # Apply salary filters
-                    cur, amount = _parse_salary(job.get("salary", ""))
-                    if (
-                        (cur == "USD" and min_usd and amount < min_usd)
-                        or (cur == "BRL" and min_brl and amount < min_brl)
-                    ):
-                        continue
+    Sharing the driver avoids a Chrome cold start per site.
+    """
+    driver = _setup_selenium_driver()
+    try:
+        return [_scrape_one_site(site, match_skills, min_usd, min_brl, driver) for site in sites]
+    finally:
+        if driver is not None:
+            driver.quit()
 
-                    site_jobs.append(job)
-                    page_jobs_added += 1
-                    print(f"✓ Job {len(site_jobs)}/{max_jobs} added: {job.get('title', 'Unknown title')}")
 
-                print(f"Added {page_jobs_added} jobs from this page")
+def scrape_jobs(config_path: str | Path) -> List[Dict[str, Any]]:
+    """Scrape job listings defined in *config_path*.
 
-                # Check if we should continue to next page
-                if len(site_jobs) >= max_jobs:
-                    print(f"Reached target of {max_jobs} jobs for {site.get('name')}")
-                    break
+    The configuration must contain a ``sites`` list and may include ``skills``
+    keywords as well as ``salary`` thresholds in USD or BRL.
 
-                # Get next page URL if pagination is configured
-                if "pagination" in site:
-                    next_url = _get_next_page_url(soup, current_url, site["pagination"])
-                    if next_url and next_url != current_url:
-                        current_url = next_url
-                        time.sleep(1)  # Be respectful between pages
-                    else:
-                        print("No more pages available")
-                        break
-                else:
-                    # No pagination configured, stop after first page
-                    break
+    Enhanced to support individual job page extraction, pagination, and infinite scroll.
+    Sites are scraped concurrently in worker threads: each request-based site
+    gets its own worker, while infinite-scroll sites share one worker and one
+    browser. Results keep the order of ``sites`` in the configuration.
+    """
+    config_path = Path(config_path)
+    with config_path.open("r", encoding="utf-8") as fh:
+        config = yaml.safe_load(fh)
 
-            except Exception as e:
-                print(f"Error scraping page {current_url}: {e}")
-                break
+    match_skills = _make_skill_matcher(config.get("skills", []))
+    salary_cfg = config.get("salary", {})
+    min_usd = salary_cfg.get("usd")
+    min_brl = salary_cfg.get("brl")
 
-        jobs.extend(site_jobs)
-        print(f"Total jobs collected from {site.get('name')}: {len(site_jobs)}")
+    sites = config.get("sites", [])
+    # Entries older than the longest TTL in use can never be read again
+    _prune_detail_cache(
+        max((site.get("detail_cache_ttl", DETAIL_CACHE_TTL) for site in sites), default=0)
+    )
+    browser_indexes = [idx for idx, site in enumerate(sites) if _uses_infinite_scroll(site)]
+    site_results: List[Any] = [None] * len(sites)
 
-    print(f"Total jobs found across all sites: {len(jobs)}")
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_SITE_WORKERS, len(sites)))) as executor:
+            # Browser sites are the slowest, so they are started first
+            browser_future = None
+            if browser_indexes:
+                browser_future = executor.submit(
+                    _scrape_browser_sites,
+                    [sites[idx] for idx in browser_indexes],
+                    match_skills,
+                    min_usd,
+                    min_brl,
+                )
+            for idx, site in enumerate(sites):
+                if not _uses_infinite_scroll(site):
+                    site_results[idx] = executor.submit(
+                        _scrape_one_site, site, match_skills, min_usd, min_brl
+                    )
+
+            if browser_future is not None:
+                for idx, result in zip(browser_indexes, browser_future.result()):
+                    site_results[idx] = result
+
+            jobs: List[Dict[str, Any]] = []
+            for result in site_results:
+                jobs.extend(result.result() if isinstance(result, Future) else result)
+    finally:
+        # Parse workers are only needed while scraping
+        _shutdown_parse_pool()
+
+    logger.info("Total jobs found across all sites: %d", len(jobs))
     return jobs
 
 
 if __name__ == "__main__":
-    import argparse, json
+    import argparse
+
+    from log_config import setup_logging
 
     parser = argparse.ArgumentParser(description="Scrape job listings")
     parser.add_argument("--config", default="../config/job_config.yaml")
     args = parser.parse_args()
+    setup_logging()
     results = scrape_jobs(args.config)
     print(json.dumps(results, indent=2, ensure_ascii=False))